@@ -1,7 +1,7 @@
 import pygame
 import random
-import time
 import heapq
+import math
 from collections import deque
 
 # Basic grid and window configuration
@@ -12,6 +12,8 @@ WIDTH, HEIGHT = COLS * CELL_SIZE, ROWS * CELL_SIZE
 # Start and goal positions
 START = (0, 0)
 TARGET = (19, 19)
+START_IDX = START[0] * COLS + START[1]
+TARGET_IDX = TARGET[0] * COLS + TARGET[1]
 
 # Probability for random obstacles appearing during search
 DYNAMIC_OBSTACLE_PROB = 0.05
@@ -19,6 +21,10 @@ DYNAMIC_OBSTACLE_PROB = 0.05
 # Depth limit used by DLS
 DEPTH_LIMIT = 30
 
+# Animation speed (frames per second) and explored cells added per frame
+FPS = 60
+FRAME_STRIDE = 4
+
 TITLE = "GOOD PERFORMANCE TIME APP"
 
 # Movement directions (clockwise with diagonals)
@@ -31,6 +37,13 @@ MOVES = [
     (-1, -1),   # up-left
 ]
 
+# Step cost of each move in thousandths (diagonals cost 1.414)
+MOVE_COSTS = [1000, 1000, 1414, 1000, 1000, 1414]
+
+# Cells are stored as flat indices (r * COLS + c) so that the search
+# state can live in plain arrays instead of tuple-keyed dicts and sets.
+NUM_CELLS = ROWS * COLS
+
 # Color definitions for visualization
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -41,81 +54,138 @@ PURPLE = (160, 32, 240)
 GRAY = (200, 200, 200)
 
 
+def build_neighbor_tables():
+    """
+    Precompute the in-bounds neighbors of every cell, in move order,
+    together with the step cost of reaching each one.
+    """
+    neighbor_idx, neighbor_cost = [], []
+
+    for idx in range(NUM_CELLS):
+        r, c = divmod(idx, COLS)
+        cells, costs = [], []
+        for (dr, dc), step_cost in zip(MOVES, MOVE_COSTS):
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < ROWS and 0 <= nc < COLS:
+                cells.append(nr * COLS + nc)
+                costs.append(step_cost)
+        neighbor_idx.append(tuple(cells))
+        neighbor_cost.append(tuple(costs))
+
+    return neighbor_idx, neighbor_cost
+
+
+NEIGHBOR_IDX, NEIGHBOR_COST = build_neighbor_tables()
+
+# Stack-based searches push neighbors in reverse so they pop in move order.
+NEIGHBOR_IDX_REVERSED = [cells[::-1] for cells in NEIGHBOR_IDX]
+
+
+def to_index(cell):
+    """Convert a (row, col) cell to its flat index."""
+    return cell[0] * COLS + cell[1]
+
+
+def to_cell(idx):
+    """Convert a flat index back to a (row, col) cell."""
+    return divmod(idx, COLS)
+
+
 class Grid:
     """
     Represents the environment.
-    Keeps track of static and dynamic obstacles.
+    Keeps track of static and dynamic obstacles in a single bitmap.
     """
 
     def __init__(self):
-        self.walls = set()
-        self.dynamic_walls = set()
-
-    def in_bounds(self, r, c):
-        """Check if a cell is inside the grid."""
-        return 0 <= r < ROWS and 0 <= c < COLS
+        self.blocked = bytearray(NUM_CELLS)
+        self.steps_until_wall = self.next_wall_gap()
 
-    def is_blocked(self, cell):
+    def is_blocked(self, idx):
         """Check if a cell is blocked by any obstacle."""
-        return cell in self.walls or cell in self.dynamic_walls
+        return self.blocked[idx]
+
+    def next_wall_gap(self):
+        """
+        Draw how many search steps pass before the next dynamic obstacle.
+        The gap is geometric, which matches an independent
+        DYNAMIC_OBSTACLE_PROB chance per step but costs one random number
+        per obstacle instead of one per step.
+        """
+        if DYNAMIC_OBSTACLE_PROB <= 0:
+            return math.inf
+        if DYNAMIC_OBSTACLE_PROB >= 1:
+            return 0
+        return int(math.log(1.0 - random.random()) / math.log(1.0 - DYNAMIC_OBSTACLE_PROB))
 
     def spawn_dynamic_wall(self):
         """
         Randomly add obstacles during search to simulate a dynamic environment.
         """
-        if random.random() < DYNAMIC_OBSTACLE_PROB:
-            cell = (random.randint(0, ROWS - 1), random.randint(0, COLS - 1))
-            if cell not in (START, TARGET) and cell not in self.walls:
-                self.dynamic_walls.add(cell)
-
+        if self.steps_until_wall:
+            self.steps_until_wall -= 1
+            return
 
-def neighbors(grid, node):
-    """
-    Generate valid neighboring cells based on movement rules.
-    """
-    for dr, dc in MOVES:
-        nr, nc = node[0] + dr, node[1] + dc
-        if grid.in_bounds(nr, nc):
-            yield (nr, nc)
+        self.steps_until_wall = self.next_wall_gap()
+        idx = random.randrange(NUM_CELLS)
+        if idx != START_IDX and idx != TARGET_IDX:
+            self.blocked[idx] = 1
 
 
 def bfs(grid, start, goal):
     """
     Breadth-First Search using a queue.
     Explores level by level.
+    Every cell is enqueued at most once, so the queue is a preallocated
+    array with head/tail cursors. Expanded cells are compacted into the
+    consumed part of the queue, which then holds the explored order.
     """
-    queue = deque([start])
-    parent = {start: None}
-    explored = []
-
-    while queue:
-        current = queue.popleft()
-        explored.append(current)
+    start, goal = to_index(start), to_index(goal)
+    blocked = grid.blocked
+    queue = [0] * NUM_CELLS
+    queue[0] = start
+    head, tail, expanded = 0, 1, 0
+    parent = [-1] * NUM_CELLS
+    parent[start] = start
+
+    while head < tail:
+        current = queue[head]
+        head += 1
+        if blocked[current] and current != start:
+            continue
+        queue[expanded] = current
+        expanded += 1
 
         if current == goal:
             break
 
         grid.spawn_dynamic_wall()
 
-        for nxt in neighbors(grid, current):
-            if nxt not in parent and not grid.is_blocked(nxt):
+        for nxt in NEIGHBOR_IDX[current]:
+            if parent[nxt] < 0 and not blocked[nxt]:
                 parent[nxt] = current
-                queue.append(nxt)
+                queue[tail] = nxt
+                tail += 1
 
-    return reconstruct_path(parent, start, goal), explored
+    return reconstruct_path(parent, start, goal), queue[:expanded]
 
 
 def dfs(grid, start, goal):
     """
     Depth-First Search using a stack.
-    Reversing neighbors preserves the intended move order.
+    Pushing neighbors in reverse preserves the intended move order.
     """
+    start, goal = to_index(start), to_index(goal)
+    blocked = grid.blocked
     stack = [start]
-    parent = {start: None}
+    parent = [-1] * NUM_CELLS
+    parent[start] = start
     explored = []
 
     while stack:
         current = stack.pop()
+        if blocked[current] and current != start:
+            continue
         explored.append(current)
 
         if current == goal:
@@ -123,8 +193,8 @@ def dfs(grid, start, goal):
 
         grid.spawn_dynamic_wall()
 
-        for nxt in reversed(list(neighbors(grid, current))):
-            if nxt not in parent and not grid.is_blocked(nxt):
+        for nxt in NEIGHBOR_IDX_REVERSED[current]:
+            if parent[nxt] < 0 and not blocked[nxt]:
                 parent[nxt] = current
                 stack.append(nxt)
 
@@ -135,14 +205,92 @@ def ucs(grid, start, goal):
     """
     Uniform Cost Search.
     Always expands the least-cost node first.
+    Path costs are integers, so nodes are kept in FIFO buckets keyed by
+    cost and only the handful of distinct bucket costs go on the heap.
+    A cell pushed again at a lower cost leaves a stale entry behind,
+    which is skipped once the cell has been expanded.
     """
-    pq = [(0, start)]
-    parent = {start: None}
-    cost = {start: 0}
+    start, goal = to_index(start), to_index(goal)
+    blocked = grid.blocked
+    buckets = {0: deque([start])}
+    levels = [0]
+    parent = [-1] * NUM_CELLS
+    parent[start] = start
+    cost = [math.inf] * NUM_CELLS
+    cost[start] = 0
+    closed = bytearray(NUM_CELLS)
+    explored = []
+
+    while levels:
+        level = levels[0]
+        bucket = buckets[level]
+        current = bucket.popleft()
+        if not bucket:
+            del buckets[level]
+            heapq.heappop(levels)
+        if closed[current]:
+            continue
+        if blocked[current] and current != start:
+            continue
+        closed[current] = 1
+        explored.append(current)
+
+        if current == goal:
+            break
+
+        grid.spawn_dynamic_wall()
+
+        for nxt, step_cost in zip(NEIGHBOR_IDX[current], NEIGHBOR_COST[current]):
+            if blocked[nxt]:
+                continue
+
+            new_cost = cost[current] + step_cost
+
+            if new_cost < cost[nxt]:
+                cost[nxt] = new_cost
+                parent[nxt] = current
+                if new_cost in buckets:
+                    buckets[new_cost].append(nxt)
+                else:
+                    buckets[new_cost] = deque([nxt])
+                    heapq.heappush(levels, new_cost)
+
+    return reconstruct_path(parent, start, goal), explored
+
+
+def octile_distance(a, b):
+    """
+    Octile distance between two cells, in thousandths.
+    Never overestimates the cost of a path, since the allowed moves are
+    a subset of the 8 directions this distance assumes.
+    """
+    ar, ac = divmod(a, COLS)
+    br, bc = divmod(b, COLS)
+    dr, dc = abs(ar - br), abs(ac - bc)
+    return 1000 * (dr + dc) - 586 * min(dr, dc)
+
+
+def astar(grid, start, goal):
+    """
+    A* Search.
+    Expands the node with the lowest cost plus octile estimate first,
+    preferring deeper nodes on ties.
+    """
+    start, goal = to_index(start), to_index(goal)
+    blocked = grid.blocked
+    pq = [(octile_distance(start, goal), 0, start)]
+    parent = [-1] * NUM_CELLS
+    parent[start] = start
+    cost = [math.inf] * NUM_CELLS
+    cost[start] = 0
     explored = []
 
     while pq:
-        _, current = heapq.heappop(pq)
+        _, neg_g, current = heapq.heappop(pq)
+        if -neg_g > cost[current]:
+            continue
+        if blocked[current] and current != start:
+            continue
         explored.append(current)
 
         if current == goal:
@@ -150,18 +298,17 @@ def ucs(grid, start, goal):
 
         grid.spawn_dynamic_wall()
 
-        for nxt in neighbors(grid, current):
-            if grid.is_blocked(nxt):
+        for nxt, step_cost in zip(NEIGHBOR_IDX[current], NEIGHBOR_COST[current]):
+            if blocked[nxt]:
                 continue
 
-            diagonal = abs(nxt[0] - current[0]) == 1 and abs(nxt[1] - current[1]) == 1
-            step_cost = 1.414 if diagonal else 1
             new_cost = cost[current] + step_cost
 
-            if nxt not in cost or new_cost < cost[nxt]:
+            if new_cost < cost[nxt]:
                 cost[nxt] = new_cost
                 parent[nxt] = current
-                heapq.heappush(pq, (new_cost, nxt))
+                f = new_cost + octile_distance(nxt, goal)
+                heapq.heappush(pq, (f, -new_cost, nxt))
 
     return reconstruct_path(parent, start, goal), explored
 
@@ -171,12 +318,17 @@ def dls(grid, start, goal, limit):
     Depth-Limited Search.
     DFS with a depth cutoff.
     """
+    start, goal = to_index(start), to_index(goal)
+    blocked = grid.blocked
     stack = [(start, 0)]
-    parent = {start: None}
+    parent = [-1] * NUM_CELLS
+    parent[start] = start
     explored = []
 
     while stack:
         current, depth = stack.pop()
+        if blocked[current] and current != start:
+            continue
         explored.append(current)
 
         if current == goal:
@@ -186,8 +338,8 @@ def dls(grid, start, goal, limit):
 
         grid.spawn_dynamic_wall()
 
-        for nxt in reversed(list(neighbors(grid, current))):
-            if nxt not in parent and not grid.is_blocked(nxt):
+        for nxt in NEIGHBOR_IDX_REVERSED[current]:
+            if parent[nxt] < 0 and not blocked[nxt]:
                 parent[nxt] = current
                 stack.append((nxt, depth + 1))
 
@@ -197,125 +349,200 @@ def dls(grid, start, goal, limit):
 def iddfs(grid, start, goal):
     """
     Iterative Deepening DFS.
-    Repeatedly runs DLS with increasing depth limits.
+    Runs a depth-limited DFS whose limit doubles each round. Cells cut
+    off at the limit are resumed in the next round instead of restarting
+    from the start, and a cell is only expanded again when it is reached
+    at a shallower depth.
     """
-    explored_total = []
+    start, goal = to_index(start), to_index(goal)
+    blocked = grid.blocked
+    parent = [-1] * NUM_CELLS
+    parent[start] = start
+    depth_seen = [NUM_CELLS] * NUM_CELLS
+    depth_seen[start] = 0
+    stack = [(start, 0)]
+    explored = []
+    limit = 1
+
+    while stack:
+        cutoff = []
 
-    for depth in range(ROWS * COLS):
-        path, explored = dls(grid, start, goal, depth)
-        explored_total.extend(explored)
+        while stack:
+            current, depth = stack.pop()
+            if depth > depth_seen[current]:
+                continue
+            if blocked[current] and current != start:
+                continue
 
-        if path:
-            return path, explored_total
+            if depth == limit and current != goal:
+                cutoff.append((current, depth))
+                continue
 
-    return [], explored_total
+            explored.append(current)
+
+            if current == goal:
+                return reconstruct_path(parent, start, goal), explored
+
+            grid.spawn_dynamic_wall()
+
+            for nxt in NEIGHBOR_IDX_REVERSED[current]:
+                if depth + 1 < depth_seen[nxt] and not blocked[nxt]:
+                    depth_seen[nxt] = depth + 1
+                    parent[nxt] = current
+                    stack.append((nxt, depth + 1))
+
+        stack = cutoff[::-1]
+        limit *= 2
+
+    return [], explored
+
+
+def expand_layer(grid, frontier, parent, dist, other_dist, best, meet, explored):
+    """
+    Expand one whole BFS layer for one side of a bidirectional search.
+    Cells that became blocked after being queued are skipped.
+    Returns the next layer and the best meeting point seen so far.
+    """
+    blocked = grid.blocked
+    next_frontier = []
+
+    for current in frontier:
+        if blocked[current] and parent[current] != current:
+            continue
+        explored.append(current)
+        grid.spawn_dynamic_wall()
+
+        for nxt in NEIGHBOR_IDX[current]:
+            if dist[nxt] < 0 and not blocked[nxt]:
+                parent[nxt] = current
+                dist[nxt] = dist[current] + 1
+                next_frontier.append(nxt)
+                if other_dist[nxt] >= 0 and dist[nxt] + other_dist[nxt] < best:
+                    best, meet = dist[nxt] + other_dist[nxt], nxt
+
+    return next_frontier, best, meet
 
 
 def bidirectional(grid, start, goal):
     """
     Bidirectional search.
-    Runs BFS simultaneously from start and goal.
+    Runs BFS from start and goal, always growing the smaller frontier by
+    a whole layer, and stops once no unexplored path can be shorter than
+    the best meeting point found.
     """
-    q1, q2 = deque([start]), deque([goal])
-    p1, p2 = {start: None}, {goal: None}
+    start, goal = to_index(start), to_index(goal)
+    p1, p2 = [-1] * NUM_CELLS, [-1] * NUM_CELLS
+    p1[start], p2[goal] = start, goal
+    d1, d2 = [-1] * NUM_CELLS, [-1] * NUM_CELLS
+    d1[start], d2[goal] = 0, 0
+    f1, f2 = [start], [goal]
+    depth1 = depth2 = 0
+    best, meet = (0, start) if start == goal else (math.inf, -1)
     explored = []
 
-    while q1 and q2:
-        a = q1.popleft()
-        b = q2.popleft()
-        explored.extend([a, b])
+    # Any path not seen yet needs an edge between the two frontiers.
+    while f1 and f2 and depth1 + depth2 + 1 < best:
+        if len(f1) <= len(f2):
+            f1, best, meet = expand_layer(grid, f1, p1, d1, d2, best, meet, explored)
+            depth1 += 1
+        else:
+            f2, best, meet = expand_layer(grid, f2, p2, d2, d1, best, meet, explored)
+            depth2 += 1
 
-        grid.spawn_dynamic_wall()
+    if meet < 0:
+        return [], explored
 
-        for nxt in neighbors(grid, a):
-            if nxt not in p1 and not grid.is_blocked(nxt):
-                p1[nxt] = a
-                q1.append(nxt)
-                if nxt in p2:
-                    return merge_paths(p1, p2, nxt), explored
-
-        for nxt in neighbors(grid, b):
-            if nxt not in p2 and not grid.is_blocked(nxt):
-                p2[nxt] = b
-                q2.append(nxt)
-                if nxt in p1:
-                    return merge_paths(p1, p2, nxt), explored
-
-    return [], explored
+    return merge_paths(p1, p2, meet), explored
 
 
 def reconstruct_path(parent, start, goal):
-    """Rebuild path from goal to start using parent links."""
-    if goal not in parent:
+    """
+    Rebuild path from goal to start using parent links.
+    The start cell is its own parent, which ends the walk.
+    """
+    if parent[goal] < 0:
         return []
 
-    path = []
+    path = [goal]
     current = goal
-    while current:
-        path.append(current)
+    while current != start:
         current = parent[current]
+        path.append(current)
 
     return path[::-1]
 
 
 def merge_paths(p1, p2, meet):
     """Merge paths from bidirectional search."""
-    path1 = []
+    path1 = [meet]
     current = meet
-    while current:
-        path1.append(current)
+    while p1[current] != current:
         current = p1[current]
+        path1.append(current)
     path1.reverse()
 
     path2 = []
-    current = p2[meet]
-    while current:
-        path2.append(current)
+    current = meet
+    while p2[current] != current:
         current = p2[current]
+        path2.append(current)
 
     return path1 + path2
 
 
-def draw(screen, grid, explored, path):
-    """Draw grid, explored nodes, obstacles, and final path."""
-    screen.fill(WHITE)
+def make_background():
+    """Render the empty grid once so frames can start from a copy of it."""
+    background = pygame.Surface((WIDTH, HEIGHT))
+    background.fill(WHITE)
 
     for r in range(ROWS):
         for c in range(COLS):
             pygame.draw.rect(
-                screen, GRAY,
+                background, GRAY,
                 (c * CELL_SIZE, r * CELL_SIZE, CELL_SIZE, CELL_SIZE), 1
             )
 
-    for cell in explored:
-        pygame.draw.rect(
-            screen, BLUE,
-            (cell[1] * CELL_SIZE, cell[0] * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-        )
-
-    for cell in grid.walls | grid.dynamic_walls:
-        pygame.draw.rect(
-            screen, BLACK,
-            (cell[1] * CELL_SIZE, cell[0] * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-        )
-
-    for cell in path:
-        pygame.draw.rect(
-            screen, PURPLE,
-            (cell[1] * CELL_SIZE, cell[0] * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-        )
-
-    pygame.draw.rect(
-        screen, GREEN,
-        (START[1] * CELL_SIZE, START[0] * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-    )
-    pygame.draw.rect(
-        screen, RED,
-        (TARGET[1] * CELL_SIZE, TARGET[0] * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-    )
+    return background
+
+
+def cell_rect(idx):
+    """Screen rectangle covered by a cell."""
+    r, c = divmod(idx, COLS)
+    return pygame.Rect(c * CELL_SIZE, r * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+
+
+def make_tiles(color, cells):
+    """
+    Pair one solid tile of the given color with the rectangle of every
+    cell, ready to be drawn in a single Surface.blits call.
+    """
+    tile = pygame.Surface((CELL_SIZE, CELL_SIZE))
+    tile.fill(color)
+    return [(tile, cell_rect(idx)) for idx in cells]
+
+
+def draw(screen, explored_layer, walls, path):
+    """
+    Draw explored nodes, obstacles, and final path.
+    explored_layer is the background with explored cells already filled in;
+    walls and path are tile lists from make_tiles.
+    """
+    screen.blit(explored_layer, (0, 0))
+    screen.blits(walls, doreturn=False)
+    screen.blits(path, doreturn=False)
+
+    screen.fill(GREEN, cell_rect(START_IDX))
+    screen.fill(RED, cell_rect(TARGET_IDX))
 
     pygame.display.update()
-    time.sleep(0.05)
+
+
+def quit_requested():
+    """
+    Drain pending events so the window stays responsive.
+    Returns True if the user closed the window.
+    """
+    return any(event.type == pygame.QUIT for event in pygame.event.get())
 
 
 def run(algorithm):
@@ -332,6 +559,8 @@ def run(algorithm):
         path, explored = dfs(grid, START, TARGET)
     elif algorithm == "ucs":
         path, explored = ucs(grid, START, TARGET)
+    elif algorithm == "astar":
+        path, explored = astar(grid, START, TARGET)
     elif algorithm == "dls":
         path, explored = dls(grid, START, TARGET, DEPTH_LIMIT)
     elif algorithm == "iddfs":
@@ -339,18 +568,35 @@ def run(algorithm):
     else:
         path, explored = bidirectional(grid, START, TARGET)
 
-    for i in range(len(explored)):
-        draw(screen, grid, explored[:i + 1], [])
+    explored_layer = make_background()
+    wall_cells = [idx for idx, blocked in enumerate(grid.blocked) if blocked]
+    walls = make_tiles(BLACK, wall_cells)
+    path_tiles = make_tiles(PURPLE, path)
+    clock = pygame.time.Clock()
+
+    for i, idx in enumerate(explored, 1):
+        explored_layer.fill(BLUE, cell_rect(idx))
+        if i % FRAME_STRIDE and i < len(explored):
+            continue
+
+        if quit_requested():
+            pygame.quit()
+            return
+        draw(screen, explored_layer, walls, [])
+        clock.tick(FPS)
+
+    for i in range(len(path_tiles)):
+        if quit_requested():
+            pygame.quit()
+            return
+        draw(screen, explored_layer, walls, path_tiles[:i + 1])
+        clock.tick(FPS)
 
-    for i in range(len(path)):
-        draw(screen, grid, explored, path[:i + 1])
+    while not quit_requested():
+        clock.tick(FPS)
 
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                return
+    pygame.quit()
 
 
 if __name__ == "__main__":
-    run("bfs")   # bfs | dfs | ucs | dls | iddfs | bi
+    run("bfs")   # bfs | dfs | ucs | astar | dls | iddfs | bi